@@ -59,7 +59,9 @@ ObjectClass Collection::get(ID id) {
   // sanity check
   static_assert(std::is_base_of<Object, ObjectClass>::value, "Requested class is not a SCINE database object.");
   auto selection = document{} << "_id" << id.bsoncxx() << finalize;
-  auto optional = this->_collection->find_one(selection.view());
+  mongocxx::options::find options{};
+  options.projection(document{} << "_id" << 1 << finalize);
+  auto optional = this->_collection->find_one(selection.view(), options);
   if (!optional) {
     throw Exceptions::IDNotFoundException();
   }
@@ -125,14 +127,18 @@ ObjectClass Collection::getOne(const std::string& filter, const std::string& sor
 
 bool Collection::has(const ID& id) {
   auto selection = document{} << "_id" << id.bsoncxx() << finalize;
-  auto optional = this->_collection->find_one(selection.view());
+  mongocxx::options::find options{};
+  options.projection(document{} << "_id" << 1 << finalize);
+  auto optional = this->_collection->find_one(selection.view(), options);
   return static_cast<bool>(optional);
 }
 
 template<class ObjectClass>
 bool Collection::has(const ID& id) {
   auto selection = document{} << "_id" << id.bsoncxx() << finalize;
-  auto optional = this->_collection->find_one(selection.view());
+  mongocxx::options::find options{};
+  options.projection(document{} << "_objecttype" << 1 << finalize);
+  auto optional = this->_collection->find_one(selection.view(), options);
   if (!optional) {
     return false;
   }
@@ -189,6 +195,14 @@ unsigned int Collection::count(const std::string& selection) {
   return this->_collection->count_documents(bsoncxx::from_json(selection));
 }
 
+unsigned int Collection::deleteMany(const std::string& selection) {
+  auto result = this->_collection->delete_many(bsoncxx::from_json(selection));
+  if (!result) {
+    return 0;
+  }
+  return result->deleted_count();
+}
+
 template<class ObjectClass>
 Collection::CollectionLooper<ObjectClass> Collection::iteratorQuery(const std::string& selection) {
   return CollectionLooper<ObjectClass>(*this, bsoncxx::from_json(selection));
@@ -166,6 +166,16 @@ class Collection : public std::enable_shared_from_this<Collection> {
    * @return unsigned int The number of documents matching the query.
    */
   unsigned count(const std::string& selection);
+  /**
+   * @brief Removes all objects that match a given query.
+   *
+   * Cheaper than dropping and recreating the collection when only its
+   * content should be discarded, the collection itself and its indices remain.
+   *
+   * @param selection The query, given as a json string.
+   * @return unsigned int The number of documents removed.
+   */
+  unsigned deleteMany(const std::string& selection);
   /**
    * @brief A small helper to allow loops over documents in the database.
    *
@@ -39,6 +39,15 @@ std::string ID::string() const {
   return this->_oid->to_string();
 }
 
+std::vector<ID> ID::batch(std::size_t n) {
+  std::vector<ID> ids;
+  ids.reserve(n);
+  for (std::size_t i = 0; i < n; ++i) {
+    ids.emplace_back();
+  }
+  return ids;
+}
+
 bsoncxx::oid ID::bsoncxx() const {
   return *(this->_oid);
 }
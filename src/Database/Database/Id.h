@@ -10,6 +10,7 @@
 /* External Includes */
 #include <memory>
 #include <string>
+#include <vector>
 
 namespace bsoncxx {
 inline namespace v_noabi {
@@ -61,6 +62,12 @@ class ID {
    * @return std::string Returns the string version of the ID.
    */
   std::string string() const;
+  /**
+   * @brief Generates several new IDs at once.
+   * @param n The number of IDs to generate.
+   * @return std::vector<ID> The new IDs in order of their generation.
+   */
+  static std::vector<ID> batch(std::size_t n);
   // @brief Comparsion.
   bool operator==(const ID& other) const;
   // @brief Comparsion.
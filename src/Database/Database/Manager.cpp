@@ -234,6 +234,16 @@ void Manager::init(bool moreIndices) {
     calculations.create_index(std::move(main), std::move(partial));
     auto status = document{} << "status" << 1 << finalize;
     calculations.create_index(std::move(status));
+
+    mongocxx::collection properties = db.collection("properties");
+    // clang-format off
+    auto origin = document{} << "calculation" << 1
+                             << "structure" << 1
+                             << "property_name" << 1
+                             << finalize;
+    // clang-format on
+    auto originName = document{} << "name" << "calc_struct_name_idx" << finalize;
+    properties.create_index(std::move(origin), std::move(originName));
   }
 }
 
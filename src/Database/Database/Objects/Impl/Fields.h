@@ -324,7 +324,9 @@ inline bool nonNull(const Object& obj, const std::string& field) {
                               << close_array
                               << finalize;
   // clang-format on
-  auto optional = collection->mongocxx().find_one(selection.view());
+  mongocxx::options::find options{};
+  options.projection(document{} << "_id" << 1 << finalize);
+  auto optional = collection->mongocxx().find_one(selection.view(), options);
   return static_cast<bool>(optional);
 }
 
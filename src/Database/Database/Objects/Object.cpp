@@ -125,7 +125,9 @@ void Object::wipe(bool expectPresence) {
     throw Exceptions::MissingLinkedCollectionException();
   auto selection = document{} << "_id" << this->id().bsoncxx() << finalize;
   if (expectPresence) {
-    auto optional = _collection->mongocxx().find_one(selection.view());
+    mongocxx::options::find options{};
+    options.projection(document{} << "_id" << 1 << finalize);
+    auto optional = _collection->mongocxx().find_one(selection.view(), options);
     if (!optional)
       throw Exceptions::IDNotFoundException();
   }
@@ -15,6 +15,8 @@
 #include "Database/Objects/Impl/Fields.h"
 #include <Database/Objects/ReactionSide.h>
 /* External Includes */
+#include <bsoncxx/builder/basic/document.hpp>
+#include <bsoncxx/builder/basic/kvp.hpp>
 #include <bsoncxx/builder/stream/document.hpp>
 #include <mongocxx/collection.hpp>
 
@@ -56,6 +58,33 @@ ID createImpl(const std::vector<ID>& lhs, const std::vector<ID>& rhs, const Obje
   return {result->inserted_id().get_oid().value};
 }
 
+/**
+ * @brief Applies an update operator with the same value to the reactants of
+ *        the given sides, in a single database operation for both sides.
+ */
+template<typename Value>
+void updateReactants(const Reaction& reaction, const char* op, const SIDE side, const Value& value) {
+  bsoncxx::builder::basic::document sides;
+  if (side == SIDE::BOTH || side == SIDE::LHS) {
+    sides.append(bsoncxx::builder::basic::kvp("lhs", value));
+  }
+  if (side == SIDE::BOTH || side == SIDE::RHS) {
+    sides.append(bsoncxx::builder::basic::kvp("rhs", value));
+  }
+  if (sides.view().empty()) {
+    return;
+  }
+  auto selection = document{} << "_id" << reaction.id().bsoncxx() << finalize;
+  // clang-format off
+  auto update = document{} << op << bsoncxx::types::b_document{sides.view()}
+                           << "$currentDate" << open_document
+                             << "_lastmodified" << true
+                             << close_document
+                           << finalize;
+  // clang-format on
+  reaction.collection()->mongocxx().find_one_and_update(selection.view(), update.view());
+}
+
 } // namespace
 
 constexpr const char* Reaction::objecttype;
@@ -177,63 +206,13 @@ SIDE Reaction::hasReactant(const ID& id) const {
 void Reaction::addReactant(const ID& id, const SIDE side) const {
   if (!_collection)
     throw Exceptions::MissingLinkedCollectionException();
-  if (side == SIDE::BOTH || side == SIDE::LHS) {
-    auto selection = document{} << "_id" << this->id().bsoncxx() << finalize;
-    // clang-format off
-    auto update = document{} << "$push" << open_document
-                               << "lhs" << id.bsoncxx()
-                               << close_document
-                             << "$currentDate" << open_document
-                               << "_lastmodified" << true
-                               << close_document
-                             << finalize;
-    // clang-format on
-    _collection->mongocxx().find_one_and_update(selection.view(), update.view());
-  }
-  if (side == SIDE::BOTH || side == SIDE::RHS) {
-    auto selection = document{} << "_id" << this->id().bsoncxx() << finalize;
-    // clang-format off
-    auto update = document{} << "$push" << open_document
-                               << "rhs" << id.bsoncxx()
-                               << close_document
-                             << "$currentDate" << open_document
-                               << "_lastmodified" << true
-                               << close_document
-                             << finalize;
-    // clang-format on
-    _collection->mongocxx().find_one_and_update(selection.view(), update.view());
-  }
+  updateReactants(*this, "$push", side, id.bsoncxx());
 }
 
 void Reaction::removeReactant(const ID& id, const SIDE side) const {
   if (!_collection)
     throw Exceptions::MissingLinkedCollectionException();
-  if (side == SIDE::BOTH || side == SIDE::LHS) {
-    auto selection = document{} << "_id" << this->id().bsoncxx() << finalize;
-    // clang-format off
-    auto update = document{} << "$pull" << open_document
-                               << "lhs" << id.bsoncxx()
-                               << close_document
-                             << "$currentDate" << open_document
-                               << "_lastmodified" << true
-                               << close_document
-                             << finalize;
-    // clang-format on
-    _collection->mongocxx().find_one_and_update(selection.view(), update.view());
-  }
-  if (side == SIDE::BOTH || side == SIDE::RHS) {
-    auto selection = document{} << "_id" << this->id().bsoncxx() << finalize;
-    // clang-format off
-    auto update = document{} << "$pull" << open_document
-                               << "rhs" << id.bsoncxx()
-                               << close_document
-                             << "$currentDate" << open_document
-                               << "_lastmodified" << true
-                               << close_document
-                             << finalize;
-    // clang-format on
-    _collection->mongocxx().find_one_and_update(selection.view(), update.view());
-  }
+  updateReactants(*this, "$pull", side, id.bsoncxx());
 }
 
 void Reaction::setReactants(const std::vector<ID>& ids, const SIDE side) const {
@@ -243,32 +222,7 @@ void Reaction::setReactants(const std::vector<ID>& ids, const SIDE side) const {
   for (const auto& id : ids) {
     array.append(id.bsoncxx());
   }
-  if (side == SIDE::BOTH || side == SIDE::LHS) {
-    auto selection = document{} << "_id" << this->id().bsoncxx() << finalize;
-    // clang-format off
-    auto update = document{} << "$set" << open_document
-                               << "lhs" << array
-                               << close_document
-                             << "$currentDate" << open_document
-                               << "_lastmodified" << true
-                               << close_document
-                             << finalize;
-    // clang-format on
-    _collection->mongocxx().find_one_and_update(selection.view(), update.view());
-  }
-  if (side == SIDE::BOTH || side == SIDE::RHS) {
-    auto selection = document{} << "_id" << this->id().bsoncxx() << finalize;
-    // clang-format off
-    auto update = document{} << "$set" << open_document
-                               << "rhs" << array
-                               << close_document
-                             << "$currentDate" << open_document
-                               << "_lastmodified" << true
-                               << close_document
-                             << finalize;
-    // clang-format on
-    _collection->mongocxx().find_one_and_update(selection.view(), update.view());
-  }
+  updateReactants(*this, "$set", side, array.view());
 }
 
 std::tuple<std::vector<ID>, std::vector<ID>> Reaction::getReactants(const SIDE side) const {
@@ -326,32 +280,8 @@ std::tuple<int, int> Reaction::hasReactants() const {
 void Reaction::clearReactants(const SIDE side) const {
   if (!_collection)
     throw Exceptions::MissingLinkedCollectionException();
-  if (side == SIDE::BOTH || side == SIDE::LHS) {
-    auto selection = document{} << "_id" << this->id().bsoncxx() << finalize;
-    // clang-format off
-    auto update = document{} << "$set" << open_document
-                               << "lhs" << open_array << close_array
-                               << close_document
-                             << "$currentDate" << open_document
-                               << "_lastmodified" << true
-                               << close_document
-                             << finalize;
-    // clang-format on
-    _collection->mongocxx().find_one_and_update(selection.view(), update.view());
-  }
-  if (side == SIDE::BOTH || side == SIDE::RHS) {
-    auto selection = document{} << "_id" << this->id().bsoncxx() << finalize;
-    // clang-format off
-    auto update = document{} << "$set" << open_document
-                               << "rhs" << open_array << close_array
-                               << close_document
-                             << "$currentDate" << open_document
-                               << "_lastmodified" << true
-                               << close_document
-                             << finalize;
-    // clang-format on
-    _collection->mongocxx().find_one_and_update(selection.view(), update.view());
-  }
+  bsoncxx::builder::basic::array empty;
+  updateReactants(*this, "$set", side, empty.view());
 }
 
 } /* namespace Database */
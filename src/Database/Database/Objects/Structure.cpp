@@ -17,6 +17,7 @@
 #include <Utils/Geometry/ElementInfo.h>
 #include <bsoncxx/builder/concatenate.hpp>
 #include <bsoncxx/builder/stream/document.hpp>
+#include <bsoncxx/types.hpp>
 #include <mongocxx/collection.hpp>
 
 using bsoncxx::builder::concatenate;
@@ -316,6 +317,28 @@ void Structure::addProperty(const std::string& key, const ID& id) const {
   _collection->mongocxx().find_one_and_update(selection.view(), update.view());
 }
 
+void Structure::addProperties(const std::string& key, const std::vector<ID>& ids) const {
+  if (!_collection)
+    throw Exceptions::MissingLinkedCollectionException();
+  auto selection = document{} << "_id" << this->id().bsoncxx() << finalize;
+  bsoncxx::builder::basic::array array;
+  for (const auto& id : ids) {
+    array.append(id.bsoncxx());
+  }
+  // clang-format off
+  auto update = document{} << "$push" << open_document
+                             << "properties."+key << open_document
+                               << "$each" << array
+                               << close_document
+                             << close_document
+                           << "$currentDate" << open_document
+                             << "_lastmodified" << true
+                             << close_document
+                           << finalize;
+  // clang-format on
+  _collection->mongocxx().find_one_and_update(selection.view(), update.view());
+}
+
 void Structure::removeProperty(const std::string& key, const ID& id) const {
   if (!_collection)
     throw Exceptions::MissingLinkedCollectionException();
@@ -377,21 +400,49 @@ std::vector<ID> Structure::getProperties(const std::string& key) const {
 
 std::vector<ID> Structure::queryProperties(const std::string& key, const Model& model,
                                            std::shared_ptr<Collection> collection) const {
+  if (!_collection)
+    throw Exceptions::MissingLinkedCollectionException();
+  // Only fetch the property list for the requested key
+  auto structureSelection = document{} << "_id" << this->id().bsoncxx() << finalize;
+  mongocxx::options::find options{};
+  options.projection(document{} << "properties." + key << 1 << finalize);
+  auto optional = _collection->mongocxx().find_one(structureSelection.view(), options);
+  if (!optional)
+    throw Exceptions::MissingIdOrField();
+  auto properties = optional.value().view()["properties"];
+  if (!properties)
+    return {};
+  auto ids = properties.get_document().view()[key];
   // Return empty list if the key is not even present
-  const auto allProperties = this->getAllProperties();
-  const auto it = allProperties.find(key);
-  if (it == allProperties.end())
+  if (!ids)
     return {};
-  const auto& ids = it->second;
 
   // Setup selection for query in properties
   bsoncxx::builder::basic::array array;
-  for (const auto& id : ids) {
-    array.append(id.bsoncxx());
+  for (bsoncxx::array::element ele : ids.get_array().value) {
+    array.append(ele.get_oid());
   }
 
-  auto selection = document{} << "_id" << open_document << "$in" << array << close_document << finalize;
-  auto cursor = collection->mongocxx().find(selection.view());
+  document selection{};
+  selection << "_id" << open_document << "$in" << array << close_document;
+  // Let the server drop candidates that differ in a fixed model field, 'any' and none-like
+  // entries are resolved by the Model comparison below
+  const auto modelBson = model.toBson();
+  for (const auto& field : modelBson.view()) {
+    const std::string value = field.get_utf8().value.to_string();
+    if (Model::entryIsAny(value) || Model::entryIsNone(value))
+      continue;
+    // clang-format off
+    selection << "model." + field.key().to_string() << open_document
+                << "$in" << open_array
+                  << value << bsoncxx::types::b_regex{"^any$", "i"}
+                << close_array
+              << close_document;
+    // clang-format on
+  }
+  mongocxx::options::find findOptions{};
+  findOptions.projection(document{} << "model" << 1 << finalize);
+  auto cursor = collection->mongocxx().find(selection.view(), findOptions);
   std::vector<ID> ret;
   for (const auto& doc : cursor) {
     Model docModel(doc["model"].get_document().view());
@@ -547,8 +598,16 @@ void Structure::removeGraph(const std::string& key) const {
 bool Structure::hasGraph(const std::string& key) const {
   if (!_collection)
     throw Exceptions::MissingLinkedCollectionException();
-  const auto graphs = this->getGraphs();
-  return graphs.count(key) > 0;
+  auto selection = document{} << "_id" << this->id().bsoncxx() << finalize;
+  mongocxx::options::find options{};
+  options.projection(document{} << "graphs." + key << 1 << finalize);
+  auto optional = _collection->mongocxx().find_one(selection.view(), options);
+  if (!optional)
+    throw Exceptions::MissingIdOrField();
+  auto graphs = optional.value().view()["graphs"];
+  if (!graphs)
+    return false;
+  return static_cast<bool>(graphs.get_document().view()[key]);
 }
 
 int Structure::hasGraphs() const {
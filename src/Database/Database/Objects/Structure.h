@@ -286,6 +286,14 @@ class Structure : public Object {
    * @param id  The ID of the property to add.
    */
   void addProperty(const std::string& key, const ID& id) const;
+  /**
+   * @brief Append several properties to a given key in a single update.
+   * @throws MissingLinkedCollectionException Thrown if no collection is linked.
+   * @throws MissingIDException Thrown if the object does not have an ID.
+   * @param key The key of the properties.
+   * @param ids A vector of IDs to append.
+   */
+  void addProperties(const std::string& key, const std::vector<ID>& ids) const;
   /**
    * @brief Removes a single property from a given key.
    * @throws MissingLinkedCollectionException Thrown if no collection is linked.
@@ -149,6 +149,7 @@ void init_collection(CollectionClass& collection) {
   collection.def("random_select_structures", &Collection::randomSelect<Structure>, pybind11::arg("n_samples"));
 
   collection.def("count", &Collection::count, pybind11::arg("selection"));
+  collection.def("delete_many", &Collection::deleteMany, pybind11::arg("selection"));
 
   collection.def("iterate_calculations", &iterateQuery<Calculation>, pybind11::arg("selection"));
   collection.def("iterate_compounds", &iterateQuery<Compound>, pybind11::arg("selection"));
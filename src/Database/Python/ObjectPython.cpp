@@ -31,6 +31,13 @@ void init_id(pybind11::module& m) {
   id.def(pybind11::init<>());
   id.def(pybind11::init<std::string>(), pybind11::arg("id_str"), "Initialize from an ID string serialization");
   id.def("string", &ID::string, "Convert the identifier to string representation");
+  id.def_static("batch", &ID::batch, pybind11::arg("n"), R"delim(
+      Generate several new identifiers at once
+
+      >>> first, second = ID.batch(2)
+      >>> first < second
+      True
+    )delim");
   id.def("__str__", &ID::string);
   id.def(
       "__eq__", [](const ID& a, const ID& b) { return a == b; }, pybind11::is_operator());
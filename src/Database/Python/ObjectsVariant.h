@@ -71,7 +71,9 @@ inline DerivedObjectVariant fetchLinked(Collection& coll, const ID& id) {
   using bsoncxx::builder::stream::finalize;
 
   auto selection = document{} << "_id" << id.bsoncxx() << finalize;
-  auto optional = coll.mongocxx().find_one(selection.view());
+  mongocxx::options::find options{};
+  options.projection(document{} << "_objecttype" << 1 << "_propertytype" << 1 << finalize);
+  auto optional = coll.mongocxx().find_one(selection.view(), options);
   if (!optional) {
     throw Exceptions::IDNotFoundException();
   }
@@ -11,6 +11,7 @@
 #include "ObjectsVariant.h"
 #include <Database/Objects/BoolProperty.h>
 #include <Database/Objects/DenseMatrixProperty.h>
+#include <Database/Objects/Impl/DerivedProperty.h>
 #include <Database/Objects/Model.h>
 #include <Database/Objects/NumberProperty.h>
 #include <Database/Objects/Property.h>
@@ -77,6 +78,35 @@ void def_derived_property(const char* name, pybind11::module& m) {
   derived.def_property("data", &DerivedProperty::getData, &DerivedProperty::setData);
   derived.def("get_data", &DerivedProperty::getData);
   derived.def("set_data", &DerivedProperty::setData, pybind11::arg("data"));
+
+  derived.def(
+      "get_all_fields",
+      [](const DerivedProperty& p) {
+        const auto content = p.getRawContent();
+        const auto view = content.view();
+        auto optionalId = [&view](const char* field) -> pybind11::object {
+          if (view.find(field) == view.cend()) {
+            return pybind11::none();
+          }
+          return pybind11::cast(ID{view[field].get_oid().value});
+        };
+
+        pybind11::dict fields;
+        fields["property_name"] = pybind11::cast(view["property_name"].get_utf8().value.to_string());
+        fields["model"] = pybind11::cast(Model{view["model"].get_document().view()});
+        fields["comment"] = pybind11::cast(view["comment"].get_utf8().value.to_string());
+        fields["structure"] = optionalId("structure");
+        fields["calculation"] = optionalId("calculation");
+        fields["data"] = pybind11::cast(Serialization::Serializer<T>::deserialize(view));
+        return fields;
+      },
+      R"delim(
+      Fetch all fields of the property with a single database operation
+
+      :return: A dictionary with the keys ``property_name``, ``model``,
+        ``comment``, ``structure``, ``calculation`` and ``data``. The
+        structure and calculation entries are ``None`` if not set.
+    )delim");
 }
 
 } // namespace
@@ -211,7 +241,9 @@ void init_properties(pybind11::module& m) {
         }
 
         auto selection = document{} << "_id" << p.id().bsoncxx() << finalize;
-        auto optional = p.collection()->mongocxx().find_one(selection.view());
+        mongocxx::options::find options{};
+        options.projection(document{} << "_objecttype" << 1 << "_propertytype" << 1 << finalize);
+        auto optional = p.collection()->mongocxx().find_one(selection.view(), options);
         if (!optional) {
           throw Exceptions::IDNotFoundException();
         }
@@ -274,6 +274,7 @@ void init_structure(pybind11::class_<Structure, Object>& structure) {
   structure.def("get_property", &Structure::getProperty, pybind11::arg("key"));
   structure.def("set_property", &Structure::setProperty, pybind11::arg("key"), pybind11::arg("id"));
   structure.def("add_property", &Structure::addProperty, pybind11::arg("key"), pybind11::arg("id"));
+  structure.def("add_properties", &Structure::addProperties, pybind11::arg("key"), pybind11::arg("ids"));
   structure.def("remove_property", &Structure::removeProperty, pybind11::arg("key"), pybind11::arg("id"));
   structure.def("set_properties", &Structure::setProperties, pybind11::arg("key"), pybind11::arg("ids"));
   structure.def("get_properties", &Structure::getProperties, pybind11::arg("key"));
@@ -211,6 +211,27 @@ class CollectionTest(unittest.TestCase):
         # Check
         assert result == 2
 
+    def test_delete_many_by_dict(self):
+        # Make sure the DB is clean in order to allow for accurate counts.
+        self.manager.wipe()
+        self.manager.init()
+        # Setup
+        coll = self.manager.get_collection("compounds")
+        id1 = db.ID()
+        id2 = db.ID()
+        comp1 = db.Compound.make([id1], coll)
+        _ = db.Compound.make([id1], coll)
+        comp3 = db.Compound.make([id2], coll)
+
+        query = {"structures": {"$eq": {"$oid": id1.string()}}}
+        result = coll.delete_many(dumps(query))
+
+        # Check
+        assert result == 2
+        assert coll.count("{}") == 1
+        assert not coll.has(comp1.id())
+        assert coll.has(comp3.id())
+
     def test_loop(self):
         # Make sure the DB is clean in order to allow for accurate counts.
         self.manager.wipe()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+__copyright__ = """This code is licensed under the 3-clause BSD license.
+Copyright ETH Zurich, Laboratory of Physical Chemistry, Reiher Group.
+See LICENSE.txt for details.
+"""
+
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+
+MONGO_DB_HOST = "127.0.0.1"
+MONGO_DB_PORT = 27017
+
+
+def _mongo_db_reachable():
+    try:
+        with socket.create_connection((MONGO_DB_HOST, MONGO_DB_PORT), timeout=1.0):
+            return True
+    except OSError:
+        return False
+
+
+def pytest_configure(config):
+    """
+    Start a throwaway MongoDB server for the whole test session if no
+    database is configured via ``TEST_MONGO_DB_IP`` and none is running on
+    the local host.
+
+    Only the controlling process starts the server, pytest-xdist workers
+    inherit ``TEST_MONGO_DB_IP`` from its environment.
+    """
+    if hasattr(config, "workerinput") or os.environ.get("TEST_MONGO_DB_IP"):
+        return
+    mongod = shutil.which("mongod")
+    if mongod is None or _mongo_db_reachable():
+        return
+
+    # Nothing needs to survive the session, keep the files in memory if possible
+    dbpath = tempfile.mkdtemp(prefix="scine_database_test_", dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+    subprocess.run([mongod, "--dbpath", dbpath, "--bind_ip", MONGO_DB_HOST, "--port", str(MONGO_DB_PORT),
+                    "--wiredTigerCacheSizeGB", "1", "--fork", "--logpath", os.path.join(dbpath, "mongod.log")],
+                   check=True, stdout=subprocess.DEVNULL)
+    config.mongod_dbpath = dbpath
+    os.environ["TEST_MONGO_DB_IP"] = MONGO_DB_HOST
+
+
+def pytest_unconfigure(config):
+    """ Shut down the MongoDB server started in pytest_configure, if any """
+    dbpath = getattr(config, "mongod_dbpath", None)
+    if dbpath is None:
+        return
+    subprocess.run([shutil.which("mongod"), "--shutdown", "--dbpath", dbpath], stdout=subprocess.DEVNULL)
+    shutil.rmtree(dbpath, ignore_errors=True)
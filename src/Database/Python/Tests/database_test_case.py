@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+__copyright__ = """This code is licensed under the 3-clause BSD license.
+Copyright ETH Zurich, Laboratory of Physical Chemistry, Reiher Group.
+See LICENSE.txt for details.
+"""
+
+import scine_database as db
+import os
+
+
+class DatabaseTestMixin:
+    """
+    Gives a unittest.TestCase a database of its own, named by the
+    ``database_name`` class attribute.
+
+    The database is set up once per test case. After each test only the
+    collections the test obtained via ``_get_collection`` are emptied,
+    dropping and re-initializing the whole database for each test is slow.
+    """
+    database_name = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.manager = db.Manager()
+        cls.manager.credentials.hostname = os.environ.get(
+            'TEST_MONGO_DB_IP') or '127.0.0.1'
+        cls.manager.credentials.database_name = cls.database_name
+        cls.manager.connect()
+        cls.manager.wipe()
+        cls.manager.init()
+        cls._colls = {}
+        cls._collections_touched = set()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.manager.wipe()
+        cls.manager.disconnect()
+
+    def tearDown(self):
+        for name in self._collections_touched:
+            self._colls[name].delete_many("{}")
+        self._collections_touched.clear()
+
+    def _get_collection(self, name):
+        self._collections_touched.add(name)
+        if name not in self._colls:
+            self._colls[name] = self.manager.get_collection(name)
+        return self._colls[name]
+
+    def _expect_raises(self, obj, cases):
+        # cases: (method, arguments) pairs of calls on obj that have to fail
+        for name, args in cases:
+            with self.subTest(name=name):
+                with self.assertRaises(RuntimeError):
+                    getattr(obj, name)(*args)
@@ -29,3 +29,9 @@ class IdTest(unittest.TestCase):
         ref = db.ID()
         copy = ref
         assert copy == ref
+
+    def test_batch(self):
+        ids = db.ID.batch(5)
+        assert len(ids) == 5
+        assert len(set(i.string() for i in ids)) == 5
+        assert ids == sorted(ids)
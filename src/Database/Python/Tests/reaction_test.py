@@ -7,28 +7,40 @@ See LICENSE.txt for details.
 import scine_utilities as utils
 import scine_database as db
 import unittest
-import os
 
-
-class ReactionTest(unittest.TestCase):
-    def setUp(self):
-        self.manager = db.Manager()
-        self.manager.credentials.hostname = os.environ.get(
-            'TEST_MONGO_DB_IP') or '127.0.0.1'
-        self.manager.credentials.database_name = "unittest_db_ReactionTest"
-        self.manager.connect()
-        self.manager.init()
-
-    def tearDown(self):
-        self.manager.wipe()
+from database_test_case import DatabaseTestMixin
+
+# (method, arguments) of calls that require a linked collection and an ID
+REACTANT_FAILURES = (
+    ("has_reactant", (db.ID(),)),
+    ("has_reactants", ()),
+    ("get_reactants", (db.Side.BOTH,)),
+    ("add_reactant", (db.ID(), db.Side.BOTH)),
+    ("set_reactants", ([], db.Side.BOTH)),
+    ("remove_reactant", (db.ID(), db.Side.BOTH)),
+    ("clear_reactants", (db.Side.BOTH,)),
+)
+ELEMENTARY_STEP_FAILURES = (
+    ("has_elementary_step", (db.ID(),)),
+    ("has_elementary_steps", ()),
+    ("get_elementary_steps", ()),
+    ("add_elementary_step", (db.ID(),)),
+    ("set_elementary_steps", ([],)),
+    ("remove_elementary_step", (db.ID(),)),
+    ("clear_elementary_steps", ()),
+)
+
+
+class ReactionTest(DatabaseTestMixin, unittest.TestCase):
+    database_name = "unittest_db_ReactionTest"
 
     def test_creation_one(self):
-        coll = self.manager.get_collection("reactions")
+        coll = self._get_collection("reactions")
         reaction = db.Reaction.make([db.ID()], [db.ID()], coll)
         assert reaction.has_id()
 
     def test_creation_two(self):
-        coll = self.manager.get_collection("reactions")
+        coll = self._get_collection("reactions")
         reaction = db.Reaction()
         reaction.link(coll)
         sid = reaction.create([db.ID()], [db.ID()])
@@ -36,9 +48,8 @@ class ReactionTest(unittest.TestCase):
 
     def test_reactants_lhs(self):
         # Basic setup
-        coll = self.manager.get_collection("reactions")
-        id1 = db.ID()
-        id2 = db.ID()
+        coll = self._get_collection("reactions")
+        id1, id2 = db.ID.batch(2)
         reaction = db.Reaction.make([id1], [id2], coll)
         assert reaction.has_id()
 
@@ -47,18 +58,13 @@ class ReactionTest(unittest.TestCase):
         assert reaction.has_reactant(id2) == db.Side.RHS
         assert 1 == reaction.has_reactants()[0]
         assert 1 == reaction.has_reactants()[1]
-        id3 = db.ID()
-        id4 = db.ID()
-        id5 = db.ID()
-        id6 = db.ID()
+        id3, id4, id5, id6 = db.ID.batch(4)
         reaction.add_reactant(id3, db.Side.LHS)
         assert reaction.has_reactant(id3) == db.Side.LHS
         assert 2 == reaction.has_reactants()[0]
         assert 1 == reaction.has_reactants()[1]
         reactants = reaction.get_reactants(db.Side.LHS)
-        assert reactants[0][0], id1
-        assert reactants[0][1], id3
-        assert len(reactants[1]) == 0
+        assert (tuple(reactants[0]), tuple(reactants[1])) == ((id1, id3), ())
         reaction.set_reactants([id4, id5, id6], db.Side.LHS)
         assert 3 == reaction.has_reactants()[0]
         reaction.remove_reactant(id5, db.Side.LHS)
@@ -68,9 +74,8 @@ class ReactionTest(unittest.TestCase):
 
     def test_reactants_rhs(self):
         # Basic setup
-        coll = self.manager.get_collection("reactions")
-        id1 = db.ID()
-        id2 = db.ID()
+        coll = self._get_collection("reactions")
+        id1, id2 = db.ID.batch(2)
         reaction = db.Reaction.make([id1], [id2], coll)
         assert reaction.has_id()
 
@@ -79,18 +84,13 @@ class ReactionTest(unittest.TestCase):
         assert reaction.has_reactant(id2) == db.Side.RHS
         assert 1 == reaction.has_reactants()[0]
         assert 1 == reaction.has_reactants()[1]
-        id3 = db.ID()
-        id4 = db.ID()
-        id5 = db.ID()
-        id6 = db.ID()
+        id3, id4, id5, id6 = db.ID.batch(4)
         reaction.add_reactant(id3, db.Side.RHS)
         assert reaction.has_reactant(id3) == db.Side.RHS
         assert 1 == reaction.has_reactants()[0]
         assert 2 == reaction.has_reactants()[1]
         reactants = reaction.get_reactants(db.Side.RHS)
-        assert reactants[1][0], id1
-        assert reactants[1][1], id3
-        assert len(reactants[0]) == 0
+        assert (tuple(reactants[0]), tuple(reactants[1])) == ((), (id2, id3))
         reaction.set_reactants([id4, id5, id6], db.Side.RHS)
         assert 3 == reaction.has_reactants()[1]
         reaction.remove_reactant(id5, db.Side.RHS)
@@ -100,9 +100,8 @@ class ReactionTest(unittest.TestCase):
 
     def test_reactants_both(self):
         # Basic setup
-        coll = self.manager.get_collection("reactions")
-        id1 = db.ID()
-        id2 = db.ID()
+        coll = self._get_collection("reactions")
+        id1, id2 = db.ID.batch(2)
         reaction = db.Reaction.make([id1], [id2], coll)
         assert reaction.has_id()
 
@@ -111,19 +110,13 @@ class ReactionTest(unittest.TestCase):
         assert reaction.has_reactant(id2) == db.Side.RHS
         assert 1 == reaction.has_reactants()[0]
         assert 1 == reaction.has_reactants()[1]
-        id3 = db.ID()
-        id4 = db.ID()
-        id5 = db.ID()
-        id6 = db.ID()
+        id3, id4, id5, id6 = db.ID.batch(4)
         reaction.add_reactant(id3, db.Side.BOTH)
         assert reaction.has_reactant(id3) == db.Side.BOTH
         assert 2 == reaction.has_reactants()[0]
         assert 2 == reaction.has_reactants()[1]
         reactants = reaction.get_reactants(db.Side.BOTH)
-        assert reactants[0][0] == id1
-        assert reactants[0][1] == id3
-        assert reactants[1][0] == id2
-        assert reactants[1][1] == id3
+        assert (tuple(reactants[0]), tuple(reactants[1])) == ((id1, id3), (id2, id3))
         reaction.set_reactants([id4, id5, id6], db.Side.BOTH)
         assert 3 == reaction.has_reactants()[0]
         assert 3 == reaction.has_reactants()[1]
@@ -134,43 +127,10 @@ class ReactionTest(unittest.TestCase):
         assert 0 == reaction.has_reactants()[0]
         assert 0 == reaction.has_reactants()[1]
 
-    def test_reactant_fails_collection(self):
-        reaction = db.Reaction(db.ID())
-        self.assertRaises(RuntimeError, lambda: reaction.has_reactant(db.ID()))
-        self.assertRaises(RuntimeError, lambda: reaction.has_reactants())
-        self.assertRaises(
-            RuntimeError, lambda: reaction.get_reactants(db.Side.BOTH))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.add_reactant(db.ID(), db.Side.BOTH))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.set_reactants([], db.Side.BOTH))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.remove_reactant(db.ID(), db.Side.BOTH))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.clear_reactants(db.Side.BOTH))
-
-    def test_reactant_fails_id(self):
-        coll = self.manager.get_collection("reactions")
-        reaction = db.Reaction()
-        reaction.link(coll)
-        self.assertRaises(RuntimeError, lambda: reaction.has_reactant(db.ID()))
-        self.assertRaises(RuntimeError, lambda: reaction.has_reactants())
-        self.assertRaises(
-            RuntimeError, lambda: reaction.get_reactants(db.Side.BOTH))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.add_reactant(db.ID(), db.Side.BOTH))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.set_reactants([], db.Side.BOTH))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.remove_reactant(db.ID(), db.Side.BOTH))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.clear_reactants(db.Side.BOTH))
-
-    def test_elementary_steps(self):
+    def test_elementary_steps_add(self):
         # Basic setup
-        coll = self.manager.get_collection("reactions")
-        id1 = db.ID()
-        id2 = db.ID()
+        coll = self._get_collection("reactions")
+        id1, id2 = db.ID.batch(2)
         reaction = db.Reaction.make([id1], [id2], coll)
         assert reaction.has_id()
         # Checks
@@ -179,53 +139,54 @@ class ReactionTest(unittest.TestCase):
         reaction.add_elementary_step(id2)
         assert reaction.has_elementary_step(id2)
         assert 1 == reaction.has_elementary_steps()
-        id3 = db.ID()
-        id4 = db.ID()
-        id5 = db.ID()
+
+    def test_elementary_steps_set(self):
+        # Basic setup
+        coll = self._get_collection("reactions")
+        id1, id2, id3, id4, id5 = db.ID.batch(5)
+        reaction = db.Reaction.make([id1], [id2], coll)
+        # Checks
         reaction.set_elementary_steps([id3, id4, id5])
         assert 3 == reaction.has_elementary_steps()
-        ret = reaction.get_elementary_steps()
-        assert ret[0] == id3
-        assert ret[1] == id4
-        assert ret[2] == id5
+        assert tuple(reaction.get_elementary_steps()) == (id3, id4, id5)
+
+    def test_elementary_steps_remove(self):
+        # Basic setup
+        coll = self._get_collection("reactions")
+        id1, id2, id3, id4, id5 = db.ID.batch(5)
+        reaction = db.Reaction.make([id1], [id2], coll)
+        reaction.set_elementary_steps([id3, id4, id5])
+        # Checks
         reaction.remove_elementary_step(id4)
-        assert 2 == reaction.has_elementary_steps()
         assert not reaction.has_elementary_step(id4)
+        assert tuple(reaction.get_elementary_steps()) == (id3, id5)
+
+    def test_elementary_steps_clear(self):
+        # Basic setup
+        coll = self._get_collection("reactions")
+        id1, id2, id3 = db.ID.batch(3)
+        reaction = db.Reaction.make([id1], [id2], coll)
+        reaction.add_elementary_step(id3)
+        # Checks
         reaction.clear_elementary_steps()
         assert 0 == reaction.has_elementary_steps()
 
+    def test_reactant_fails_collection(self):
+        reaction = db.Reaction(db.ID())
+        self._expect_raises(reaction, REACTANT_FAILURES)
+
+    def test_reactant_fails_id(self):
+        coll = self._get_collection("reactions")
+        reaction = db.Reaction()
+        reaction.link(coll)
+        self._expect_raises(reaction, REACTANT_FAILURES)
+
     def test_elementary_step_fails_collection(self):
         reaction = db.Reaction(db.ID())
-        self.assertRaises(
-            RuntimeError, lambda: reaction.has_elementary_step(db.ID()))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.has_elementary_steps())
-        self.assertRaises(
-            RuntimeError, lambda: reaction.get_elementary_steps())
-        self.assertRaises(
-            RuntimeError, lambda: reaction.add_elementary_step(db.ID()))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.set_elementary_steps([]))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.remove_elementary_step(db.ID()))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.clear_elementary_steps())
+        self._expect_raises(reaction, ELEMENTARY_STEP_FAILURES)
 
     def test_elementary_step_fails_id(self):
-        coll = self.manager.get_collection("reactions")
+        coll = self._get_collection("reactions")
         reaction = db.Reaction()
         reaction.link(coll)
-        self.assertRaises(
-            RuntimeError, lambda: reaction.has_elementary_step(db.ID()))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.has_elementary_steps())
-        self.assertRaises(
-            RuntimeError, lambda: reaction.get_elementary_steps())
-        self.assertRaises(
-            RuntimeError, lambda: reaction.add_elementary_step(db.ID()))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.set_elementary_steps([]))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.remove_elementary_step(db.ID()))
-        self.assertRaises(
-            RuntimeError, lambda: reaction.clear_elementary_steps())
+        self._expect_raises(reaction, ELEMENTARY_STEP_FAILURES)
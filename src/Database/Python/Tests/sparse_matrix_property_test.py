@@ -10,29 +10,21 @@ import unittest
 import numpy as np
 from scipy.sparse import rand
 
-import os
+from database_test_case import DatabaseTestMixin
 
+MODEL = db.Model("dft", "pbe", "def2-svp")
 
-class SparseMatrixPropertyTest(unittest.TestCase):
-    def setUp(self):
-        self.manager = db.Manager()
-        self.manager.credentials.hostname = os.environ.get(
-            'TEST_MONGO_DB_IP') or '127.0.0.1'
-        self.manager.credentials.database_name = "unittest_db_SparseMatrixPropertyTest"
-        self.manager.connect()
-        self.manager.init()
 
-    def tearDown(self):
-        self.manager.wipe()
+class SparseMatrixPropertyTest(DatabaseTestMixin, unittest.TestCase):
+    database_name = "unittest_db_SparseMatrixPropertyTest"
 
     def test_make_one(self):
         # Setup
-        coll = self.manager.get_collection("properties")
+        coll = self._get_collection("properties")
         c = db.ID()
         s = db.ID()
-        model = db.Model("dft", "pbe", "def2-svp")
         ref = rand(1000, 10, density=0.2, format='csr')
-        test = db.SparseMatrixProperty.make("density_matrix", model, ref, s, c, coll)
+        test = db.SparseMatrixProperty.make("density_matrix", MODEL, ref, s, c, coll)
         assert test.has_id()
 
         # Check Fields
@@ -54,10 +46,9 @@ class SparseMatrixPropertyTest(unittest.TestCase):
 
     def test_make_two(self):
         # Setup
-        coll = self.manager.get_collection("properties")
-        model = db.Model("dft", "pbe", "def2-svp")
+        coll = self._get_collection("properties")
         ref = rand(1000, 10, density=0.2, format='csr')
-        test = db.SparseMatrixProperty.make("density_matrix", model, ref, coll)
+        test = db.SparseMatrixProperty.make("density_matrix", MODEL, ref, coll)
         assert test.has_id()
 
         # Check Fields
@@ -77,41 +68,35 @@ class SparseMatrixPropertyTest(unittest.TestCase):
 
     def test_create_one(self):
         # Setup
-        coll = self.manager.get_collection("properties")
+        coll = self._get_collection("properties")
         c = db.ID()
         s = db.ID()
-        model = db.Model("dft", "pbe", "def2-svp")
         test = db.SparseMatrixProperty()
         test.link(coll)
         ref = rand(1000, 10, density=0.2, format='csr')
-        test.create(model,"density_matrix", s, c, ref)
+        test.create(MODEL,"density_matrix", s, c, ref)
         assert test.has_id()
 
         # Check Fields
-        model = test.get_model()
-        comment = test.get_comment()
-        name = test.get_property_name()
-        calculation = test.get_calculation()
-        structure = test.get_structure()
-        data_db = test.get_data()
+        fields = test.get_all_fields()
+        model = fields["model"]
 
         assert model.method == "pbe"
         assert model.basis_set == "def2-svp"
         assert model.spin_mode == "any"
-        assert comment == ""
-        assert name == "density_matrix"
-        assert calculation.string() == c.string()
-        assert structure.string() == s.string()
-        assert np.array_equal(data_db.todense(), ref.todense())
+        assert fields["comment"] == ""
+        assert fields["property_name"] == "density_matrix"
+        assert fields["calculation"].string() == c.string()
+        assert fields["structure"].string() == s.string()
+        assert np.array_equal(fields["data"].todense(), ref.todense())
 
     def test_create_two(self):
         # Setup
-        coll = self.manager.get_collection("properties")
-        model = db.Model("dft", "pbe", "def2-svp")
+        coll = self._get_collection("properties")
         test = db.SparseMatrixProperty()
         test.link(coll)
         ref = rand(1000, 10, density=0.2, format='csr')
-        test.create(model, "density_matrix", ref)
+        test.create(MODEL, "density_matrix", ref)
         assert test.has_id()
 
         # Check Fields
@@ -127,16 +112,18 @@ class SparseMatrixPropertyTest(unittest.TestCase):
         assert name == "density_matrix"
         assert not test.has_calculation()
         assert not test.has_structure()
+        fields = test.get_all_fields()
+        assert fields["calculation"] is None
+        assert fields["structure"] is None
         assert np.array_equal(data_db.todense(), ref.todense())
 
     def test_data(self):
         # Setup
-        coll = self.manager.get_collection("properties")
+        coll = self._get_collection("properties")
         s = db.ID()
         c = db.ID()
-        model = db.Model("dft", "pbe", "def2-svp")
         ref = rand(1000, 10, density=0.2, format='csr')
-        test = db.SparseMatrixProperty.make("density_matrix", model, ref, s, c, coll)
+        test = db.SparseMatrixProperty.make("density_matrix", MODEL, ref, s, c, coll)
         assert test.has_id()
 
         assert np.array_equal(test.get_data().todense(), ref.todense())
@@ -146,7 +133,7 @@ class SparseMatrixPropertyTest(unittest.TestCase):
 
     def test_data_failure(self):
         # Setup
-        coll = self.manager.get_collection("properties")
+        coll = self._get_collection("properties")
         test = db.SparseMatrixProperty()
         ref = rand(1000, 10, density=0.2, format='csr')
         self.assertRaises(RuntimeError, lambda: test.set_data(ref))
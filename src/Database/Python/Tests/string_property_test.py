@@ -7,29 +7,22 @@ See LICENSE.txt for details.
 import scine_utilities as utils
 import scine_database as db
 import unittest
-import os
 
+from database_test_case import DatabaseTestMixin
 
-class StringPropertyTest(unittest.TestCase):
-    def setUp(self):
-        self.manager = db.Manager()
-        self.manager.credentials.hostname = os.environ.get(
-            'TEST_MONGO_DB_IP') or '127.0.0.1'
-        self.manager.credentials.database_name = "unittest_db_StringPropertyTest"
-        self.manager.connect()
-        self.manager.init()
+MODEL = db.Model("dft", "pbe", "def2-svp")
 
-    def tearDown(self):
-        self.manager.wipe()
+
+class StringPropertyTest(DatabaseTestMixin, unittest.TestCase):
+    database_name = "unittest_db_StringPropertyTest"
 
     def test_make_one(self):
         # Setup
-        coll = self.manager.get_collection("properties")
+        coll = self._get_collection("properties")
         c = db.ID()
         s = db.ID()
-        model = db.Model("dft", "pbe", "def2-svp")
         test = db.StringProperty.make(
-            "density_matrix", model, "Dummy", s, c, coll)
+            "density_matrix", MODEL, "Dummy", s, c, coll)
         assert test.has_id()
 
         # Check Fields
@@ -51,9 +44,8 @@ class StringPropertyTest(unittest.TestCase):
 
     def test_make_two(self):
         # Setup
-        coll = self.manager.get_collection("properties")
-        model = db.Model("dft", "pbe", "def2-svp")
-        test = db.StringProperty.make("density_matrix", model, "Dummy", coll)
+        coll = self._get_collection("properties")
+        test = db.StringProperty.make("density_matrix", MODEL, "Dummy", coll)
         assert test.has_id()
 
         # Check Fields
@@ -73,39 +65,33 @@ class StringPropertyTest(unittest.TestCase):
 
     def test_create_one(self):
         # Setup
-        coll = self.manager.get_collection("properties")
+        coll = self._get_collection("properties")
         c = db.ID()
         s = db.ID()
-        model = db.Model("dft", "pbe", "def2-svp")
         test = db.StringProperty()
         test.link(coll)
-        test.create(model, "density_matrix", s, c, "Dummy")
+        test.create(MODEL, "density_matrix", s, c, "Dummy")
         assert test.has_id()
 
         # Check Fields
-        model = test.get_model()
-        comment = test.get_comment()
-        name = test.get_property_name()
-        calculation = test.get_calculation()
-        structure = test.get_structure()
-        data_db = test.get_data()
+        fields = test.get_all_fields()
+        model = fields["model"]
 
         assert model.method == "pbe"
         assert model.basis_set == "def2-svp"
         assert model.spin_mode == "any"
-        assert comment == ""
-        assert name == "density_matrix"
-        assert calculation.string() == c.string()
-        assert structure.string() == s.string()
-        assert data_db == "Dummy"
+        assert fields["comment"] == ""
+        assert fields["property_name"] == "density_matrix"
+        assert fields["calculation"].string() == c.string()
+        assert fields["structure"].string() == s.string()
+        assert fields["data"] == "Dummy"
 
     def test_create_two(self):
         # Setup
-        coll = self.manager.get_collection("properties")
-        model = db.Model("dft", "pbe", "def2-svp")
+        coll = self._get_collection("properties")
         test = db.StringProperty()
         test.link(coll)
-        test.create(model, "density_matrix", "Dummy")
+        test.create(MODEL, "density_matrix", "Dummy")
         assert test.has_id()
 
         # Check Fields
@@ -121,16 +107,18 @@ class StringPropertyTest(unittest.TestCase):
         assert name == "density_matrix"
         assert not test.has_calculation()
         assert not test.has_structure()
+        fields = test.get_all_fields()
+        assert fields["calculation"] is None
+        assert fields["structure"] is None
         assert data_db == "Dummy"
 
     def test_data(self):
         # Setup
-        coll = self.manager.get_collection("properties")
+        coll = self._get_collection("properties")
         s = db.ID()
         c = db.ID()
-        model = db.Model("dft", "pbe", "def2-svp")
         test = db.StringProperty.make(
-            "density_matrix", model, "Dummy", s, c, coll)
+            "density_matrix", MODEL, "Dummy", s, c, coll)
         assert test.has_id()
 
         assert test.get_data() == "Dummy"
@@ -139,7 +127,7 @@ class StringPropertyTest(unittest.TestCase):
 
     def test_data_failure(self):
         # Setup
-        coll = self.manager.get_collection("properties")
+        coll = self._get_collection("properties")
         test = db.StringProperty()
         self.assertRaises(RuntimeError, lambda: test.set_data("Dummy"))
         self.assertRaises(RuntimeError, lambda: test.get_data())
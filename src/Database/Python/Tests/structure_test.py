@@ -7,46 +7,120 @@ See LICENSE.txt for details.
 import scine_utilities as utils
 import scine_database as db
 import unittest
-import os
-
-
-class StructureTest(unittest.TestCase):
-    def setUp(self):
-        self.manager = db.Manager()
-        self.manager.credentials.hostname = os.environ.get(
-            'TEST_MONGO_DB_IP') or '127.0.0.1'
-        self.manager.credentials.database_name = "unittest_db_StructureTest"
-        self.manager.connect()
-        self.manager.init()
-        self.atoms = utils.AtomCollection(
-            [utils.ElementType.H, utils.ElementType.H], [
-                [+1.0, 0.0, 0.0],
-                [-1.0, 0.0, 0.0]
-            ]
-        )
 
-    def tearDown(self):
-        self.manager.wipe()
+from database_test_case import DatabaseTestMixin
+
+MODEL = db.Model("dft", "pbe", "def2-svp")
+# Not modified by any test
+ATOMS = utils.AtomCollection(
+    [utils.ElementType.H, utils.ElementType.H], [
+        [+1.0, 0.0, 0.0],
+        [-1.0, 0.0, 0.0]
+    ]
+)
+
+# (method, arguments) of calls that require a linked collection and an ID
+ATOMS_FAILURES = (
+    ("set_atoms", (ATOMS,)),
+    ("get_atoms", ()),
+    ("has_atoms", ()),
+    ("clear_atoms", ()),
+)
+CHARGE_FAILURES = (
+    ("set_charge", (1,)),
+    ("get_charge", ()),
+)
+MULTIPLICITY_FAILURES = (
+    ("set_multiplicity", (1,)),
+    ("get_multiplicity", ()),
+)
+MODEL_FAILURES = (
+    ("set_model", (MODEL,)),
+    ("get_model", ()),
+)
+LABEL_FAILURES = (
+    ("set_label", (db.Label.USER_GUESS,)),
+    ("get_label", ()),
+)
+COMPOUND_FAILURES = (
+    ("set_compound", (db.ID(),)),
+    ("get_compound", ()),
+    ("has_compound", ()),
+    ("clear_compound", ()),
+)
+GRAPH_FAILURES = (
+    ("set_graph", ("frown", "HHC=CHH")),
+    ("get_graph", ("frown",)),
+    ("has_graph", ("frown",)),
+    ("set_graphs", ({},)),
+    ("get_graphs", ()),
+    ("has_graphs", ()),
+    ("remove_graph", ("frown",)),
+    ("clear_graphs", ()),
+)
+COMMENT_FAILURES = (
+    ("set_comment", ("",)),
+    ("get_comment", ()),
+    ("has_comment", ()),
+    ("clear_comment", ()),
+)
+PROPERTY_FAILURES = (
+    ("has_property", ("key",)),
+    ("has_property", (db.ID(),)),
+    ("get_property", ("key",)),
+    ("set_property", ("key", db.ID())),
+    ("add_property", ("key", db.ID())),
+    ("add_properties", ("key", [db.ID()])),
+    ("remove_property", ("key", db.ID())),
+    ("set_properties", ("key", [])),
+    ("get_properties", ("key",)),
+    ("has_properties", ("key",)),
+    ("clear_properties", ("key",)),
+    ("get_all_properties", ()),
+    ("set_all_properties", ({"key": [db.ID()]},)),
+    ("clear_all_properties", ()),
+)
+
+
+class StructureTest(DatabaseTestMixin, unittest.TestCase):
+    database_name = "unittest_db_StructureTest"
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # IDs only used as references, never inserted themselves
+        cls._ids = db.ID.batch(16)
+
+    def _make_structure(self):
+        coll = self._get_collection("structures")
+        structure = db.Structure.make(
+            ATOMS, 0, 1, MODEL, db.Label.MINIMUM_GUESS, coll)
+        return structure
+
+    def _check_all_raise(self, cases):
+        # Every call has to fail without a linked collection or without an ID
+        unlinked = db.Structure(db.ID())
+        without_id = db.Structure()
+        without_id.link(self._get_collection("structures"))
+        for variant, structure in (("collection", unlinked), ("id", without_id)):
+            with self.subTest(missing=variant):
+                self._expect_raises(structure, cases)
 
     def test_creation_one(self):
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure.make(self.atoms, 0, 1, coll)
-        assert structure.has_id()
+        coll = self._get_collection("structures")
+        structure = db.Structure.make(ATOMS, 0, 1, coll)
+        self.assertTrue(structure.has_id())
 
     def test_creation_two(self):
-        coll = self.manager.get_collection("structures")
+        coll = self._get_collection("structures")
         structure = db.Structure()
         structure.link(coll)
-        structure.create(self.atoms, 0, 1)
-        assert structure.has_id()
+        structure.create(ATOMS, 0, 1)
+        self.assertTrue(structure.has_id())
 
     def test_atoms(self):
         # Setup
-        model = db.Model("dft", "pbe", "def2-svp")
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure.make(
-            self.atoms, 0, 1, model, db.Label.MINIMUM_GUESS, coll)
-        assert structure.has_id()
+        structure = self._make_structure()
 
         # Checks
         atoms2 = utils.AtomCollection(
@@ -62,387 +136,238 @@ class StructureTest(unittest.TestCase):
                 [9.0, 9.0, 9.0]
             ]
         )
-        assert 2 == structure.has_atoms()
+        self.assertEqual(2, structure.has_atoms())
         ret1 = structure.get_atoms()
-        assert ret1.get_element(0) == utils.ElementType.H
-        assert ret1.get_element(1) == utils.ElementType.H
+        self.assertEqual(ret1.get_element(0), utils.ElementType.H)
+        self.assertEqual(ret1.get_element(1), utils.ElementType.H)
         structure.set_atoms(atoms2)
-        assert 4 == structure.has_atoms()
+        self.assertEqual(4, structure.has_atoms())
         ret2 = structure.get_atoms()
-        assert ret2.get_element(0) == utils.ElementType.He
-        assert ret2.get_element(1) == utils.ElementType.Ar
-        assert ret2.get_element(2) == utils.ElementType.Mo
-        assert ret2.get_element(3) == utils.ElementType.Te
+        self.assertEqual(ret2.get_element(0), utils.ElementType.He)
+        self.assertEqual(ret2.get_element(1), utils.ElementType.Ar)
+        self.assertEqual(ret2.get_element(2), utils.ElementType.Mo)
+        self.assertEqual(ret2.get_element(3), utils.ElementType.Te)
         structure.clear_atoms()
-        assert 0 == structure.has_atoms()
+        self.assertEqual(0, structure.has_atoms())
 
-    def test_atoms_fail_collection(self):
-        structure = db.Structure(db.ID())
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_atoms(self.atoms))
-        self.assertRaises(RuntimeError, lambda: structure.get_atoms())
-        self.assertRaises(RuntimeError, lambda: structure.has_atoms())
-        self.assertRaises(RuntimeError, lambda: structure.clear_atoms())
-
-    def test_atoms_fail_id(self):
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure()
-        structure.link(coll)
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_atoms(self.atoms))
-        self.assertRaises(RuntimeError, lambda: structure.get_atoms())
-        self.assertRaises(RuntimeError, lambda: structure.has_atoms())
-        self.assertRaises(RuntimeError, lambda: structure.clear_atoms())
+    def test_atoms_fails(self):
+        self._check_all_raise(ATOMS_FAILURES)
 
     def test_charge(self):
         # Setup
-        model = db.Model("dft", "pbe", "def2-svp")
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure.make(
-            self.atoms, 0, 1, model, db.Label.MINIMUM_GUESS, coll)
-        assert structure.has_id()
-        assert 0 == structure.get_charge()
+        structure = self._make_structure()
+        self.assertEqual(0, structure.get_charge())
         structure.set_charge(5)
-        assert 5 == structure.get_charge()
+        self.assertEqual(5, structure.get_charge())
         structure.set_charge(-999)
-        assert -999 == structure.get_charge()
-
-    def test_charge_fails_collection(self):
-        structure = db.Structure(db.ID())
-        self.assertRaises(RuntimeError, lambda: structure.set_charge(1))
-        self.assertRaises(RuntimeError, lambda: structure.get_charge())
+        self.assertEqual(-999, structure.get_charge())
 
-    def test_charge_fails_id(self):
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure()
-        structure.link(coll)
-        self.assertRaises(RuntimeError, lambda: structure.set_charge(1))
-        self.assertRaises(RuntimeError, lambda: structure.get_charge())
+    def test_charge_fails(self):
+        self._check_all_raise(CHARGE_FAILURES)
 
     def test_multiplicity(self):
         # Setup
-        model = db.Model("dft", "pbe", "def2-svp")
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure.make(
-            self.atoms, 0, 1, model, db.Label.MINIMUM_GUESS, coll)
-        assert structure.has_id()
-        assert 1 == structure.get_multiplicity()
+        structure = self._make_structure()
+        self.assertEqual(1, structure.get_multiplicity())
         structure.set_multiplicity(5)
-        assert 5 == structure.get_multiplicity()
+        self.assertEqual(5, structure.get_multiplicity())
         structure.set_multiplicity(-999)
-        assert -999 == structure.get_multiplicity()
+        self.assertEqual(-999, structure.get_multiplicity())
 
-    def test_multiplicity_fails_collection(self):
-        structure = db.Structure(db.ID())
-        self.assertRaises(RuntimeError, lambda: structure.set_multiplicity(1))
-        self.assertRaises(RuntimeError, lambda: structure.get_multiplicity())
-
-    def test_multiplicity_fails_id(self):
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure()
-        structure.link(coll)
-        self.assertRaises(RuntimeError, lambda: structure.set_multiplicity(1))
-        self.assertRaises(RuntimeError, lambda: structure.get_multiplicity())
+    def test_multiplicity_fails(self):
+        self._check_all_raise(MULTIPLICITY_FAILURES)
 
     def test_model(self):
         # Setup
-        model = db.Model("dft", "pbe", "def2-svp")
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure.make(
-            self.atoms, 0, 1, model, db.Label.MINIMUM_GUESS, coll)
-        assert structure.has_id()
+        structure = self._make_structure()
 
         # Check
         ret1 = structure.get_model()
-        assert ret1.basis_set == model.basis_set
-        assert ret1.temperature == model.temperature
-        assert ret1.electronic_temperature == model.electronic_temperature
-        assert ret1.method == model.method
-        assert ret1.program == model.program
+        self.assertEqual(ret1.basis_set, MODEL.basis_set)
+        self.assertEqual(ret1.temperature, MODEL.temperature)
+        self.assertEqual(
+            ret1.electronic_temperature, MODEL.electronic_temperature)
+        self.assertEqual(ret1.method, MODEL.method)
+        self.assertEqual(ret1.program, MODEL.program)
         model2 = db.Model("am1", "am1", "")
         model2.temperature = "278.0"
         model2.electronic_temperature = "5.0"
         model2.program = "sparrow"
         structure.set_model(model2)
         ret2 = structure.get_model()
-        assert ret2.basis_set == model2.basis_set
-        assert ret2.temperature == model2.temperature
-        assert ret2.electronic_temperature == model2.electronic_temperature
-        assert ret2.method == model2.method
-        assert ret2.program == model2.program
-
-    def test_model_fails_collection(self):
-        structure = db.Structure(db.ID())
-        model = db.Model("am1", "am1", "")
-        self.assertRaises(RuntimeError, lambda: structure.set_model(model))
-        self.assertRaises(RuntimeError, lambda: structure.get_model())
-
-    def test_model_fails_id(self):
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure()
-        structure.link(coll)
-        model = db.Model("am1", "am1", "")
-        self.assertRaises(RuntimeError, lambda: structure.set_model(model))
-        self.assertRaises(RuntimeError, lambda: structure.get_model())
+        self.assertEqual(ret2.basis_set, model2.basis_set)
+        self.assertEqual(ret2.temperature, model2.temperature)
+        self.assertEqual(
+            ret2.electronic_temperature, model2.electronic_temperature)
+        self.assertEqual(ret2.method, model2.method)
+        self.assertEqual(ret2.program, model2.program)
+
+    def test_model_fails(self):
+        self._check_all_raise(MODEL_FAILURES)
 
     def test_label(self):
         # Setup
-        model = db.Model("dft", "pbe", "def2-svp")
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure.make(
-            self.atoms, 0, 1, model, db.Label.MINIMUM_GUESS, coll)
-        assert structure.has_id()
+        structure = self._make_structure()
 
         # Check
-        assert db.Label.MINIMUM_GUESS == structure.get_label()
+        self.assertEqual(db.Label.MINIMUM_GUESS, structure.get_label())
         structure.set_label(db.Label.NONE)
-        assert db.Label.NONE == structure.get_label()
+        self.assertEqual(db.Label.NONE, structure.get_label())
         structure.set_label(db.Label.TS_GUESS)
-        assert db.Label.TS_GUESS == structure.get_label()
+        self.assertEqual(db.Label.TS_GUESS, structure.get_label())
 
-    def test_label_fails_collection(self):
-        structure = db.Structure(db.ID())
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_label(db.Label.USER_GUESS))
-        self.assertRaises(RuntimeError, lambda: structure.get_label())
-
-    def test_label_fails_id(self):
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure()
-        structure.link(coll)
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_label(db.Label.USER_GUESS))
-        self.assertRaises(RuntimeError, lambda: structure.get_label())
+    def test_label_fails(self):
+        self._check_all_raise(LABEL_FAILURES)
 
     def test_compound(self):
         # Setup
-        model = db.Model("dft", "pbe", "def2-svp")
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure.make(
-            self.atoms, 0, 1, model, db.Label.MINIMUM_GUESS, coll)
-        assert structure.has_id()
+        structure = self._make_structure()
 
         # Check
-        assert not structure.has_compound()
+        self.assertFalse(structure.has_compound())
         id2 = db.ID()
         structure.set_compound(id2)
-        assert structure.has_compound()
-        assert id2 == structure.get_compound()
+        self.assertTrue(structure.has_compound())
+        self.assertEqual(id2, structure.get_compound())
         structure.clear_compound()
-        assert not structure.has_compound()
+        self.assertFalse(structure.has_compound())
 
-    def test_compound_fails_collection(self):
-        structure = db.Structure(db.ID())
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_compound(db.ID()))
-        self.assertRaises(RuntimeError, lambda: structure.get_compound())
-        self.assertRaises(RuntimeError, lambda: structure.has_compound())
-        self.assertRaises(RuntimeError, lambda: structure.clear_compound())
-
-    def test_compound_fails_id(self):
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure()
-        structure.link(coll)
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_compound(db.ID()))
-        self.assertRaises(RuntimeError, lambda: structure.get_compound())
-        self.assertRaises(RuntimeError, lambda: structure.has_compound())
-        self.assertRaises(RuntimeError, lambda: structure.clear_compound())
+    def test_compound_fails(self):
+        self._check_all_raise(COMPOUND_FAILURES)
 
     def test_graph(self):
         # Setup
-        model = db.Model("dft", "pbe", "def2-svp")
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure.make(
-            self.atoms, 0, 1, model, db.Label.MINIMUM_GUESS, coll)
-        assert structure.has_id()
+        structure = self._make_structure()
 
         # Check
-        assert 0 == structure.has_graphs()
-        assert not structure.has_graph("FROWN")
+        self.assertEqual(0, structure.has_graphs())
+        self.assertFalse(structure.has_graph("FROWN"))
         structure.set_graph("FROWN", "HHC=CHH")
-        assert 1 == structure.has_graphs()
-        assert structure.has_graph("FROWN")
-        assert "HHC=CHH" == structure.get_graph("FROWN")
+        self.assertEqual(1, structure.has_graphs())
+        self.assertTrue(structure.has_graph("FROWN"))
+        self.assertEqual("HHC=CHH", structure.get_graph("FROWN"))
         structure.remove_graph("FROWN")
-        assert 0 == structure.has_graphs()
-        assert not structure.has_graph("FROWN")
+        self.assertEqual(0, structure.has_graphs())
+        self.assertFalse(structure.has_graph("FROWN"))
         graphs = {
             "FROWN": "ABCDEF",
             "SMILES": "FEDCBA"
         }
         structure.set_graphs(graphs)
-        assert 2 == structure.has_graphs()
-        assert structure.has_graph("FROWN")
+        self.assertEqual(2, structure.has_graphs())
+        self.assertTrue(structure.has_graph("FROWN"))
         ret = structure.get_graphs()
-        assert ret["FROWN"] == graphs["FROWN"]
-        assert ret["SMILES"] == graphs["SMILES"]
+        self.assertEqual(ret["FROWN"], graphs["FROWN"])
+        self.assertEqual(ret["SMILES"], graphs["SMILES"])
         structure.clear_graphs()
-        assert 0 == structure.has_graphs()
-        assert not structure.has_graph("FROWN")
+        self.assertEqual(0, structure.has_graphs())
+        self.assertFalse(structure.has_graph("FROWN"))
 
-    def test_graph_fails_collection(self):
-        structure = db.Structure(db.ID())
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_graph("frown", "HHC=CHH"))
-        self.assertRaises(RuntimeError, lambda: structure.get_graph("frown"))
-        self.assertRaises(RuntimeError, lambda: structure.has_graph("frown"))
-        self.assertRaises(RuntimeError, lambda: structure.set_graphs({}))
-        self.assertRaises(RuntimeError, lambda: structure.get_graphs())
-        self.assertRaises(RuntimeError, lambda: structure.has_graphs())
-        self.assertRaises(
-            RuntimeError, lambda: structure.remove_graph("frown"))
-        self.assertRaises(RuntimeError, lambda: structure.clear_graphs())
-
-    def test_graph_fails_id(self):
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure()
-        structure.link(coll)
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_graph("frown", "HHC=CHH"))
-        self.assertRaises(RuntimeError, lambda: structure.get_graph("frown"))
-        self.assertRaises(RuntimeError, lambda: structure.has_graph("frown"))
-        self.assertRaises(RuntimeError, lambda: structure.set_graphs({}))
-        self.assertRaises(RuntimeError, lambda: structure.get_graphs())
-        self.assertRaises(RuntimeError, lambda: structure.has_graphs())
-        self.assertRaises(
-            RuntimeError, lambda: structure.remove_graph("frown"))
-        self.assertRaises(RuntimeError, lambda: structure.clear_graphs())
+    def test_graph_fails(self):
+        self._check_all_raise(GRAPH_FAILURES)
 
     def test_comment(self):
         # Setup
-        model = db.Model("dft", "pbe", "def2-svp")
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure.make(
-            self.atoms, 0, 1, model, db.Label.MINIMUM_GUESS, coll)
-        assert structure.has_id()
+        structure = self._make_structure()
 
         # Check
-        assert not structure.has_comment()
+        self.assertFalse(structure.has_comment())
         structure.set_comment("foo")
-        assert structure.has_comment()
-        assert "foo" == structure.get_comment()
+        self.assertTrue(structure.has_comment())
+        self.assertEqual("foo", structure.get_comment())
         structure.clear_comment()
-        assert not structure.has_comment()
+        self.assertFalse(structure.has_comment())
 
-    def test_comment_fails_collection(self):
-        structure = db.Structure(db.ID())
-        self.assertRaises(RuntimeError, lambda: structure.set_comment(""))
-        self.assertRaises(RuntimeError, lambda: structure.get_comment())
-        self.assertRaises(RuntimeError, lambda: structure.has_comment())
-        self.assertRaises(RuntimeError, lambda: structure.clear_comment())
-
-    def test_comment_fails_id(self):
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure()
-        structure.link(coll)
-        self.assertRaises(RuntimeError, lambda: structure.set_comment(""))
-        self.assertRaises(RuntimeError, lambda: structure.get_comment())
-        self.assertRaises(RuntimeError, lambda: structure.has_comment())
-        self.assertRaises(RuntimeError, lambda: structure.clear_comment())
+    def test_comment_fails(self):
+        self._check_all_raise(COMMENT_FAILURES)
 
     def test_property_one(self):
         # Setup
-        model = db.Model("dft", "pbe", "def2-svp")
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure.make(
-            self.atoms, 0, 1, model, db.Label.MINIMUM_GUESS, coll)
-        assert structure.has_id()
+        structure = self._make_structure()
 
         # Check
-        id1 = db.ID()
-        id2 = db.ID()
-        assert not structure.has_property("hessian")
-        assert not structure.has_property(id1)
+        id1, id2 = self._ids[:2]
+        self.assertFalse(structure.has_property("hessian"))
+        self.assertFalse(structure.has_property(id1))
         structure.set_property("hessian", id1)
-        assert structure.has_property("hessian")
-        assert structure.has_property(id1)
-        assert not structure.has_property(id2)
-        assert id1 == structure.get_property("hessian")
+        self.assertTrue(structure.has_property("hessian"))
+        self.assertTrue(structure.has_property(id1))
+        self.assertFalse(structure.has_property(id2))
+        self.assertEqual(id1, structure.get_property("hessian"))
         structure.add_property("hessian", id2)
-        assert structure.has_property(id2)
+        self.assertTrue(structure.has_property(id2))
         self.assertRaises(
             RuntimeError, lambda: structure.get_property("hessian"))
         structure.remove_property("hessian", id1)
-        assert structure.has_property(id2)
-        assert not structure.has_property(id1)
+        self.assertTrue(structure.has_property(id2))
+        self.assertFalse(structure.has_property(id1))
 
     def test_property_two(self):
         # Setup
-        model = db.Model("dft", "pbe", "def2-svp")
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure.make(
-            self.atoms, 0, 1, model, db.Label.MINIMUM_GUESS, coll)
-        assert structure.has_id()
+        structure = self._make_structure()
 
         # Check
-        id1 = db.ID()
-        id2 = db.ID()
-        id3 = db.ID()
-        assert 0 == structure.has_properties("hessian")
+        id1, id2, id3 = self._ids[:3]
+        self.assertEqual(0, structure.has_properties("hessian"))
         structure.set_properties("hessian", [id1, id2])
-        assert 2 == structure.has_properties("hessian")
-        assert id1 == structure.get_properties("hessian")[0]
-        assert id2 == structure.get_properties("hessian")[1]
+        self.assertEqual(2, structure.has_properties("hessian"))
+        self.assertEqual(id1, structure.get_properties("hessian")[0])
+        self.assertEqual(id2, structure.get_properties("hessian")[1])
         structure.set_properties("hessian", [id3])
-        assert id3 == structure.get_properties("hessian")[0]
-        assert 1 == structure.has_properties("hessian")
+        self.assertEqual(id3, structure.get_properties("hessian")[0])
+        self.assertEqual(1, structure.has_properties("hessian"))
         structure.clear_properties("hessian")
-        assert 0 == structure.has_properties("hessian")
+        self.assertEqual(0, structure.has_properties("hessian"))
 
     def test_property_three(self):
         # Setup
-        model = db.Model("dft", "pbe", "def2-svp")
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure.make(
-            self.atoms, 0, 1, model, db.Label.MINIMUM_GUESS, coll)
-        assert structure.has_id()
+        structure = self._make_structure()
 
         # Check
         prop1 = {
-            "electronic_energy": [db.ID(), db.ID(), db.ID()],
-            "hessian": [db.ID(), db.ID()],
-            "gradients": [db.ID(), db.ID()],
+            "electronic_energy": self._ids[0:3],
+            "hessian": self._ids[3:5],
+            "gradients": self._ids[5:7],
         }
         prop2 = {
-            "mulliken_charges": [db.ID(), db.ID()],
-            "gradients": [db.ID(), db.ID()],
+            "mulliken_charges": self._ids[7:9],
+            "gradients": self._ids[9:11],
         }
-        assert 0 == structure.has_properties("electronic_energy")
-        assert 0 == structure.has_properties("mulliken_charges")
-        assert 0 == structure.has_properties("hessian")
-        assert 0 == structure.has_properties("gradients")
+        self.assertEqual(0, structure.has_properties("electronic_energy"))
+        self.assertEqual(0, structure.has_properties("mulliken_charges"))
+        self.assertEqual(0, structure.has_properties("hessian"))
+        self.assertEqual(0, structure.has_properties("gradients"))
         structure.set_all_properties(prop1)
         ret1 = structure.get_all_properties()
-        assert prop1["electronic_energy"][0] == ret1["electronic_energy"][0]
-        assert prop1["electronic_energy"][2] == ret1["electronic_energy"][2]
-        assert prop1["hessian"][0] == ret1["hessian"][0]
-        assert prop1["hessian"][1] == ret1["hessian"][1]
-        assert prop1["gradients"][0] == ret1["gradients"][0]
+        self.assertEqual(
+            prop1["electronic_energy"][0], ret1["electronic_energy"][0])
+        self.assertEqual(
+            prop1["electronic_energy"][2], ret1["electronic_energy"][2])
+        self.assertEqual(prop1["hessian"][0], ret1["hessian"][0])
+        self.assertEqual(prop1["hessian"][1], ret1["hessian"][1])
+        self.assertEqual(prop1["gradients"][0], ret1["gradients"][0])
         structure.set_all_properties(prop2)
         ret2 = structure.get_all_properties()
-        assert prop2["mulliken_charges"][0] == ret2["mulliken_charges"][0]
-        assert prop2["mulliken_charges"][1] == ret2["mulliken_charges"][1]
-        assert prop2["gradients"][0] == ret2["gradients"][0]
-        assert prop2["gradients"][1] == ret2["gradients"][1]
+        self.assertEqual(
+            prop2["mulliken_charges"][0], ret2["mulliken_charges"][0])
+        self.assertEqual(
+            prop2["mulliken_charges"][1], ret2["mulliken_charges"][1])
+        self.assertEqual(prop2["gradients"][0], ret2["gradients"][0])
+        self.assertEqual(prop2["gradients"][1], ret2["gradients"][1])
         structure.clear_all_properties()
-        assert 0 == structure.has_properties("electronic_energy")
-        assert 0 == structure.has_properties("mulliken_charges")
-        assert 0 == structure.has_properties("hessian")
-        assert 0 == structure.has_properties("gradients")
+        self.assertEqual(0, structure.has_properties("electronic_energy"))
+        self.assertEqual(0, structure.has_properties("mulliken_charges"))
+        self.assertEqual(0, structure.has_properties("hessian"))
+        self.assertEqual(0, structure.has_properties("gradients"))
 
     def test_property_four(self):
         # Setup
-        model = db.Model("dft", "pbe", "def2-svp")
-        structures = self.manager.get_collection("structures")
-        structure = db.Structure.make(
-            self.atoms, 0, 1, model, db.Label.MINIMUM_GUESS, structures)
-        assert structure.has_id()
+        structure = self._make_structure()
         model1 = db.Model("dft", "pbe", "def2-svp")
         model1.program = "serenity"
         model2 = db.Model("am1", "am1", "")
         model2.program = "sparrow"
-        properties = self.manager.get_collection("properties")
+        properties = self._get_collection("properties")
         sid = structure.get_id()
         cid = db.ID()
         p1 = db.NumberProperty.make(
@@ -451,90 +376,72 @@ class StructureTest(unittest.TestCase):
             "electronic_energy", model2, 2.0, sid, cid, properties)
         p3 = db.NumberProperty.make(
             "electronic_energy", model2, 3.0, sid, cid, properties)
-        structure.add_property("electronic_energy", p1.id())
-        structure.add_property("electronic_energy", p2.id())
-        structure.add_property("electronic_energy", p3.id())
+        structure.add_properties(
+            "electronic_energy", [p1.id(), p2.id(), p3.id()])
 
         # Checks
         none = db.Model("dft", "sdfasdf", "asdf")
         ret0 = structure.query_properties(
             "electronic_energy", none, properties)
-        assert 0 == len(ret0)
+        self.assertEqual(0, len(ret0))
         ret1 = structure.query_properties(
             "electronic_energy", model1, properties)
-        assert 1 == len(ret1)
+        self.assertEqual([p1.id()], ret1)
         ret2 = structure.query_properties(
             "electronic_energy", model2, properties)
-        assert 2 == len(ret2)
+        self.assertCountEqual([p2.id(), p3.id()], ret2)
         any_dft = db.Model("dft", "any", "any")
         ret3 = structure.query_properties(
             "electronic_energy", any_dft, properties)
-        assert 1 == len(ret3)
+        self.assertEqual([p1.id()], ret3)
         any_m = db.Model("any", "any", "any")
         ret4 = structure.query_properties(
             "electronic_energy", any_m, properties)
-        assert 1 == len(ret4)
+        self.assertEqual([p1.id()], ret4)
         ret5 = structure.query_properties(
             "none_existing_key", none, properties)
-        assert 0 == len(ret5)
+        self.assertEqual(0, len(ret5))
 
-    def test_property_fails_collection(self):
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure()
-        model = db.Model("dft", "pbe", "def2-svp")
-        self.assertRaises(RuntimeError, lambda: structure.has_property("key"))
-        self.assertRaises(
-            RuntimeError, lambda: structure.has_property(db.ID()))
-        self.assertRaises(RuntimeError, lambda: structure.get_property("key"))
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_property("key", db.ID()))
-        self.assertRaises(
-            RuntimeError, lambda: structure.add_property("key", db.ID()))
-        self.assertRaises(
-            RuntimeError, lambda: structure.remove_property("key", db.ID()))
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_properties("key", []))
-        self.assertRaises(
-            RuntimeError, lambda: structure.get_properties("key"))
-        self.assertRaises(
-            RuntimeError, lambda: structure.has_properties("key"))
-        self.assertRaises(
-            RuntimeError, lambda: structure.clear_properties("key"))
-        self.assertRaises(
-            RuntimeError, lambda: structure.query_properties("key", model, coll))
-        self.assertRaises(RuntimeError, lambda: structure.get_all_properties())
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_all_properties({"key": [db.ID()]}))
-        self.assertRaises(
-            RuntimeError, lambda: structure.clear_all_properties())
+    def test_property_five(self):
+        # Setup
+        structure = self._make_structure()
+        wildcards = db.Model("dft", "pbe", "def2-svp")
+        wildcards.spin_mode = "ANY"
+        wildcards.program = "Any"
+        no_basis = db.Model("dft", "pbe", "")
+        no_basis.program = "orca"
+        other_program = db.Model("dft", "pbe", "def2-svp")
+        other_program.program = "turbomole"
+        properties = self._get_collection("properties")
+        sid = structure.get_id()
+        cid = db.ID()
+        p1 = db.NumberProperty.make(
+            "electronic_energy", wildcards, 1.0, sid, cid, properties)
+        p2 = db.NumberProperty.make(
+            "electronic_energy", no_basis, 2.0, sid, cid, properties)
+        p3 = db.NumberProperty.make(
+            "electronic_energy", other_program, 3.0, sid, cid, properties)
+        structure.add_properties(
+            "electronic_energy", [p1.id(), p2.id(), p3.id()])
 
-    def test_property_fails_id(self):
-        coll = self.manager.get_collection("structures")
-        structure = db.Structure()
-        structure.link(coll)
-        model = db.Model("dft", "pbe", "def2-svp")
-        self.assertRaises(RuntimeError, lambda: structure.has_property("key"))
-        self.assertRaises(
-            RuntimeError, lambda: structure.has_property(db.ID()))
-        self.assertRaises(RuntimeError, lambda: structure.get_property("key"))
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_property("key", db.ID()))
-        self.assertRaises(
-            RuntimeError, lambda: structure.add_property("key", db.ID()))
-        self.assertRaises(
-            RuntimeError, lambda: structure.remove_property("key", db.ID()))
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_properties("key", []))
-        self.assertRaises(
-            RuntimeError, lambda: structure.get_properties("key"))
-        self.assertRaises(
-            RuntimeError, lambda: structure.has_properties("key"))
-        self.assertRaises(
-            RuntimeError, lambda: structure.clear_properties("key"))
-        self.assertRaises(
-            RuntimeError, lambda: structure.query_properties("key", model, coll))
-        self.assertRaises(RuntimeError, lambda: structure.get_all_properties())
-        self.assertRaises(
-            RuntimeError, lambda: structure.set_all_properties({"key": [db.ID()]}))
-        self.assertRaises(
-            RuntimeError, lambda: structure.clear_all_properties())
+        # Checks
+        # Stored 'any' entries of any case match fixed values, stored
+        # none-like entries do not
+        specific = db.Model("dft", "pbe", "def2-svp")
+        specific.spin_mode = "unrestricted"
+        specific.program = "orca"
+        specific.version = "5.0.0"
+        ret0 = structure.query_properties(
+            "electronic_energy", specific, properties)
+        self.assertEqual([p1.id()], ret0)
+        # None-like query entries only match none-like stored entries
+        none = db.Model("dft", "pbe", "none")
+        none.program = "orca"
+        ret1 = structure.query_properties(
+            "electronic_energy", none, properties)
+        self.assertEqual([p2.id()], ret1)
+
+    def test_property_fails(self):
+        coll = self._get_collection("properties")
+        query = ("query_properties", ("key", MODEL, coll))
+        self._check_all_raise(PROPERTY_FAILURES + (query,))
@@ -6,8 +6,8 @@ See LICENSE.txt for details.
 import importlib.util
 import os
 import sys
+import sysconfig
 from pathlib import Path
-from distutils import sysconfig
 
 expected_suffix = sysconfig.get_config_var("EXT_SUFFIX")
 expected_name = __name__ + expected_suffix
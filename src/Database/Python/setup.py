@@ -22,15 +22,11 @@ class EmptyListWithLength(list):
 
 def find_stubs(package_name: str) -> List[str]:
     """ Find typing stub files in the package directory """
-    stubs = []
-    for root, dirs, files in os.walk(package_name):
-        for file in files:
-            if not file.endswith(".pyi"):
-                continue
-
-            path = os.path.join(root, file)
-            stubs.append(path.replace(package_name + os.sep, '', 1))
-    return stubs
+    if not os.path.isdir(package_name):
+        return []
+    package_path = Path(package_name)
+    return [str(path.relative_to(package_path))
+            for path in package_path.rglob("*.pyi")]
 
 
 def collect_data(pkg_name: str) -> Dict[str, List[str]]:
@@ -43,7 +39,8 @@ def collect_data(pkg_name: str) -> Dict[str, List[str]]:
         # Typing marker file for PEP 561
         typed_filename = "py.typed"
         typed_file = Path(".") / pkg_name / typed_filename
-        typed_file.touch()
+        if not typed_file.exists():
+            typed_file.touch()
         package_data[pkg_name].extend(stubs)
         package_data[pkg_name].append(typed_filename)
 
@@ -62,7 +59,7 @@ setuptools.setup(
     url="https://www.scine.ethz.ch",
     packages=["scine_database"],
     package_data=collect_data("scine_database"),
-    nstall_requires=["scine_utilities"],
+    install_requires=["scine_utilities"],
     classifiers=[
         "Programming Language :: Python",
         "Programming Language :: C++",
@@ -236,6 +236,27 @@ TEST_F(CollectionTest, CountByJSON) {
   ASSERT_EQ(result, 2);
 }
 
+TEST_F(CollectionTest, DeleteManyByJSON) {
+  // Make sure the DB is clean in order to allow for accurate counts.
+  db.wipe();
+  db.init();
+  // Setup
+  auto coll = db.getCollection("compounds");
+  ID id1, id2;
+  Compound comp1 = Compound::create({id1}, coll);
+  Compound comp2 = Compound::create({id1}, coll);
+  Compound comp3 = Compound::create({id2}, coll);
+
+  std::string query = R"({ "structures" : { "$eq" : { "$oid" : ")" + id1.string() + "\" } } }";
+  auto result = coll->deleteMany(query);
+
+  // Check
+  ASSERT_EQ(result, 2);
+  ASSERT_EQ(coll->count("{}"), 1);
+  ASSERT_FALSE(coll->has(comp1.id()));
+  ASSERT_TRUE(coll->has(comp3.id()));
+}
+
 TEST_F(CollectionTest, TestLoop) {
   // Make sure the DB is clean in order to allow for accurate counts.
   db.wipe();
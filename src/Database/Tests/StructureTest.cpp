@@ -459,6 +459,11 @@ TEST_F(StructureTest, Property2) {
   ASSERT_EQ(1, structure.hasProperties("hessian"));
   structure.clearProperties("hessian");
   ASSERT_EQ(0, structure.hasProperties("hessian"));
+  structure.addProperties("hessian", {id1, id2});
+  structure.addProperties("hessian", {id3});
+  ASSERT_EQ(3, structure.hasProperties("hessian"));
+  ASSERT_EQ(id1, structure.getProperties("hessian")[0]);
+  ASSERT_EQ(id3, structure.getProperties("hessian")[2]);
 }
 
 TEST_F(StructureTest, Property3) {
@@ -547,6 +552,47 @@ TEST_F(StructureTest, Property4) {
   EXPECT_EQ(0, ret5.size());
 }
 
+TEST_F(StructureTest, Property5) {
+  // Setup
+  Utils::AtomCollection atoms;
+  atoms.resize(2);
+  atoms.setElement(0, Utils::ElementType::H);
+  atoms.setElement(1, Utils::ElementType::H);
+  atoms.setPosition(0, Eigen::Vector3d(+1, 0, 0));
+  atoms.setPosition(1, Eigen::Vector3d(-1, 0, 0));
+  Model wildcards("dft", "pbe", "def2-svp");
+  wildcards.spinMode = "ANY";
+  wildcards.program = "Any";
+  Model noBasis("dft", "pbe", "");
+  noBasis.program = "orca";
+  Model otherProgram("dft", "pbe", "def2-svp");
+  otherProgram.program = "turbomole";
+  auto structures = db.getCollection("structures");
+  auto properties = db.getCollection("properties");
+  Structure structure = Structure::create(atoms, 0, 1, wildcards, Structure::LABEL::MINIMUM_GUESS, structures);
+  const ID& id = structure.id();
+  ID calculation;
+  NumberProperty p1 = NumberProperty::create("electronic_energy", wildcards, 1.0, id, calculation, properties);
+  NumberProperty p2 = NumberProperty::create("electronic_energy", noBasis, 2.0, id, calculation, properties);
+  NumberProperty p3 = NumberProperty::create("electronic_energy", otherProgram, 3.0, id, calculation, properties);
+  structure.addProperties("electronic_energy", {p1.id(), p2.id(), p3.id()});
+  // Checks
+  // Stored 'any' entries of any case match fixed values, stored none-like entries do not
+  Model specific("dft", "pbe", "def2-svp");
+  specific.spinMode = "unrestricted";
+  specific.program = "orca";
+  specific.version = "5.0.0";
+  auto ret0 = structure.queryProperties("electronic_energy", specific, properties);
+  ASSERT_EQ(1, ret0.size());
+  EXPECT_EQ(p1.id(), ret0[0]);
+  // None-like query entries only match none-like stored entries
+  Model none("dft", "pbe", "none");
+  none.program = "orca";
+  auto ret1 = structure.queryProperties("electronic_energy", none, properties);
+  ASSERT_EQ(1, ret1.size());
+  EXPECT_EQ(p2.id(), ret1[0]);
+}
+
 TEST_F(StructureTest, PropertyFails1) {
   auto coll = db.getCollection("structures");
   Structure structure;
@@ -557,6 +603,7 @@ TEST_F(StructureTest, PropertyFails1) {
   ASSERT_THROW(structure.getProperty("key"), Exceptions::MissingLinkedCollectionException);
   ASSERT_THROW(structure.setProperty("key", id), Exceptions::MissingLinkedCollectionException);
   ASSERT_THROW(structure.addProperty("key", id), Exceptions::MissingLinkedCollectionException);
+  ASSERT_THROW(structure.addProperties("key", {id}), Exceptions::MissingLinkedCollectionException);
   ASSERT_THROW(structure.removeProperty("key", id), Exceptions::MissingLinkedCollectionException);
   ASSERT_THROW(structure.setProperties("key", {}), Exceptions::MissingLinkedCollectionException);
   ASSERT_THROW(structure.getProperties("key"), Exceptions::MissingLinkedCollectionException);
@@ -579,6 +626,7 @@ TEST_F(StructureTest, PropertyFails2) {
   ASSERT_THROW(structure.getProperty("key"), Exceptions::MissingIDException);
   ASSERT_THROW(structure.setProperty("key", id), Exceptions::MissingIDException);
   ASSERT_THROW(structure.addProperty("key", id), Exceptions::MissingIDException);
+  ASSERT_THROW(structure.addProperties("key", {id}), Exceptions::MissingIDException);
   ASSERT_THROW(structure.removeProperty("key", id), Exceptions::MissingIDException);
   ASSERT_THROW(structure.setProperties("key", {}), Exceptions::MissingIDException);
   ASSERT_THROW(structure.getProperties("key"), Exceptions::MissingIDException);
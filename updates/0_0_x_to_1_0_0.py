@@ -22,8 +22,8 @@ db = client[db_name]
 
 # Check version
 is_correct_old_version = False
-if "_db_meta_data" in db.list_collection_names():
-    meta_data = db["_db_meta_data"].find_one({})
+meta_data = db["_db_meta_data"].find_one({})
+if meta_data is not None:
     version = meta_data["version"]
     if version["major"] == 0 and version["minor"] == 0:
         is_correct_old_version = True
@@ -39,20 +39,17 @@ if not is_correct_old_version:
 db["elementary_steps"].update_many({"type": {"$exists": False}}, {"$set": {"type": "regular"}})
 
 # Update version
-if "_db_meta_data" in db.list_collection_names():
-    _db_meta_data = db["_db_meta_data"]
-    meta_data = db["_db_meta_data"].find_one({})
-    date = meta_data["_created"]
-    db["_db_meta_data"].delete_many({})
-else:
-    date = datetime.datetime.utcnow()
-    _db_meta_data = db["_db_meta_data"]
-post = {
-    "version": {
-        "major": 1,
-        "minor": 0,
-        "patch": 0
+db["_db_meta_data"].update_one(
+    {},
+    {
+        "$set": {
+            "version": {
+                "major": 1,
+                "minor": 0,
+                "patch": 0
+            }
+        },
+        "$setOnInsert": {"_created": datetime.datetime.utcnow()}
     },
-    "_created": date
-}
-_db_meta_data.insert_one(post)
+    upsert=True
+)